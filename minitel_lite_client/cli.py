@@ -7,6 +7,7 @@ retrieves an emergency override code, and optionally records the session.
 """
 
 import argparse
+import functools
 import json
 import os
 import sys
@@ -18,18 +19,33 @@ from minitel_lite_client.exceptions import ConnectionError, ProtocolError
 from minitel_lite_client.logger import get_logger
 from minitel_lite_client.protocol import CMD_DUMP, CMD_HELLO, CMD_STOP
 
+# orjson serializes recordings considerably faster than the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
 
-def create_arg_parser() -> argparse.ArgumentParser:
-    """Create and configure the argument parser for the MiniTel-Lite client"""
-    parser = argparse.ArgumentParser(
-        description="MiniTel-Lite Infiltration Tool - Retrieve emergency override codes from the JOSHUA system",
-        epilog="""
+_DESCRIPTION = "MiniTel-Lite Infiltration Tool - Retrieve emergency override codes from the JOSHUA system"
+_EPILOG = """
         Example usage:
           %(prog)s --host localhost --port 8080 --record-session
           %(prog)s --host 192.168.1.100 --port 8080 --no-tls
-        """,
+        """
+
+
+@functools.lru_cache(maxsize=1)
+def create_arg_parser() -> argparse.ArgumentParser:
+    """
+    Create and configure the argument parser for the MiniTel-Lite client
+
+    The parser is built once and reused by later calls.
+    """
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        epilog=_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -41,6 +57,8 @@ def create_arg_parser() -> argparse.ArgumentParser:
                                   help="Server port number to connect to")
     connection_group.add_argument("--no-tls", action="store_false",
                                   help="Disable TLS encryption for the connection")
+    connection_group.add_argument("--pipeline", action="store_true",
+                                  help="Send all session commands in one batch (server must accept pipelined frames)")
 
     # Session recording arguments
     recording_group = parser.add_argument_group("Session Recording")
@@ -65,10 +83,14 @@ def save_recording(recording: list, directory: str = "recordings") -> str:
     filename = f"minitel_lite_recording_{timestamp}.json"
     filepath = os.path.join(directory, filename)
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(recording, f, indent=2)
+    if orjson is not None:
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(recording, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(recording, f, indent=2)
 
-    logger.info(f"Session recording saved to {filepath}")
+    logger.info("Session recording saved to {}", filepath)
     return filepath
 
 
@@ -98,92 +120,95 @@ def run_client(
     try:
         # Create and connect the client (mockable in tests)
         client = client_class(args.host, args.port, use_tls=not args.no_tls)
-        logger.info(f"Connecting to {args.host}:{args.port}")
+        logger.info("Connecting to {}:{}", args.host, args.port)
+
+        # Pipelined sessions write every command frame up front
+        pipeline = args.pipeline
 
         # Session recording if enabled
         session_recording = [] if args.record_session else None
+        time_time = time.time
+        batch_timestamp = None
+
+        def record_request(request: str) -> None:
+            """Record a request event awaiting its response, stamped when it was sent"""
+            if session_recording is not None:
+                timestamp = batch_timestamp if batch_timestamp is not None else time_time()
+                session_recording.append({"timestamp": timestamp, "request": request, "response": None})
+
+        def record_response(response: Dict[str, Any]) -> None:
+            """Attach the response to the most recent request event"""
+            if session_recording is not None:
+                session_recording[-1]["response"] = response
 
         client.connect()
 
+        if pipeline:
+            # The send_command calls below then only advance the nonce state
+            session_frames = protocol.build_session_frames()
+            batch_timestamp = time_time()
+            logger.info("Sending {} pipelined commands in one write", len(session_frames))
+            client.send(b"".join(session_frames))
+
         # --- HELLO ---
-        if session_recording is not None:
-            session_recording.append({
-                "timestamp": time.time(),
-                "request": "HELLO",
-                "response": None,
-            })
+        record_request("HELLO")
 
         hello_frame = protocol.send_command(CMD_HELLO)
-        logger.info(f"Sending HELLO command with nonce {protocol.client_nonce}")
-        client.send(hello_frame)
+        if not pipeline:
+            logger.info("Sending HELLO command with nonce {}", protocol.client_nonce)
+            client.send(hello_frame)
 
         hello_response_data = client.receive()
-        logger.info(f"Received HELLO_ACK response data: {hello_response_data}")
+        logger.info("Received {} bytes of HELLO_ACK response data", len(hello_response_data))
         hello_response = protocol.handle_server_response(hello_response_data)
 
-        if session_recording is not None:
-            session_recording[-1]["response"] = hello_response
+        record_response(hello_response)
 
         # --- First DUMP ---
-        if session_recording is not None:
-            session_recording.append({
-                "timestamp": time.time(),
-                "request": "DUMP",
-                "response": None,
-            })
+        record_request("DUMP")
 
         dump_frame = protocol.send_command(CMD_DUMP)
-        logger.info(f"Sending DUMP command with nonce {protocol.client_nonce}")
-        client.send(dump_frame)
+        if not pipeline:
+            logger.info("Sending DUMP command with nonce {}", protocol.client_nonce)
+            client.send(dump_frame)
 
         dump_response_data = client.receive()
-        logger.info(f"Received DUMP response data: {dump_response_data}")
+        logger.info("Received {} bytes of DUMP response data", len(dump_response_data))
         dump_response = protocol.handle_server_response(dump_response_data)
 
-        if session_recording is not None:
-            session_recording[-1]["response"] = dump_response
+        record_response(dump_response)
 
         # --- Second DUMP ---
-        if session_recording is not None:
-            session_recording.append({
-                "timestamp": time.time(),
-                "request": "DUMP",
-                "response": None,
-            })
+        record_request("DUMP")
 
         dump_frame = protocol.send_command(CMD_DUMP)
-        logger.info(f"Sending second DUMP command with nonce {protocol.client_nonce}")
-        client.send(dump_frame)
+        if not pipeline:
+            logger.info("Sending second DUMP command with nonce {}", protocol.client_nonce)
+            client.send(dump_frame)
 
         final_dump_response_data = client.receive()
-        logger.info(f"Received final DUMP response data: {final_dump_response_data}")
+        logger.info("Received {} bytes of final DUMP response data", len(final_dump_response_data))
         final_dump_response = protocol.handle_server_response(final_dump_response_data)
 
-        if session_recording is not None:
-            session_recording[-1]["response"] = final_dump_response
+        record_response(final_dump_response)
 
         if final_dump_response.get("status") == "success" and final_dump_response.get("data"):
             result["override_code"] = final_dump_response["data"]
-            logger.info(f"Emergency override code retrieved: {result['override_code']}")
+            logger.info("Emergency override code retrieved: {}", result['override_code'])
 
         # --- STOP ---
-        if session_recording is not None:
-            session_recording.append({
-                "timestamp": time.time(),
-                "request": "STOP",
-                "response": None,
-            })
+        record_request("STOP")
 
         stop_frame = protocol.send_command(CMD_STOP)
-        logger.info(f"Sending STOP command with nonce {protocol.client_nonce}")
-        client.send(stop_frame)
+        if not pipeline:
+            logger.info("Sending STOP command with nonce {}", protocol.client_nonce)
+            client.send(stop_frame)
 
         stop_response_data = client.receive()
-        logger.info(f"Received STOP response data: {stop_response_data}")
+        logger.info("Received {} bytes of STOP response data", len(stop_response_data))
         stop_response = protocol.handle_server_response(stop_response_data)
 
-        if session_recording is not None:
-            session_recording[-1]["response"] = stop_response
+        record_response(stop_response)
 
         client.disconnect()
 
@@ -193,13 +218,13 @@ def run_client(
         result["success"] = True
 
     except ConnectionError as e:
-        logger.error(f"Connection error: {str(e)}")
+        logger.error("Connection error: {}", e)
         result["error"] = f"Connection failed: {str(e)}"
     except ProtocolError as e:
-        logger.error(f"Protocol error: {str(e)}")
+        logger.error("Protocol error: {}", e)
         result["error"] = f"Protocol error: {str(e)}"
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: {}", e, exc_info=True)
         result["error"] = f"Unexpected error: {str(e)}"
     finally:
         if "client" in locals() and client.get_connection_status():
@@ -239,7 +264,7 @@ def main():
         sys.exit(1)
     except Exception as e:
         print(f"\n❌ Unexpected error: {str(e)}")
-        logger.error(f"Unexpected error in main: {str(e)}", exc_info=True)
+        logger.error("Unexpected error in main: {}", e, exc_info=True)
         sys.exit(1)
 
 
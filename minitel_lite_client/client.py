@@ -1,12 +1,20 @@
 import socket
 import ssl
 import struct
+import threading
 from typing import Optional, Tuple
 from minitel_lite_client.exceptions import ConnectionError, TimeoutError, ProtocolError
 from minitel_lite_client.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Precompiled format of the 2-byte big-endian frame length prefix
+_LENGTH_PREFIX = struct.Struct("!H")
+
+# TLS context shared by all clients; SSLContext is safe to use from several threads
+_SHARED_SSL_CONTEXT: Optional[ssl.SSLContext] = None
+_SHARED_SSL_CONTEXT_LOCK = threading.Lock()
+
 class MiniTelLiteClient:
     """
     TCP client implementation for MiniTel-Lite Protocol Version 3.0
@@ -16,8 +24,10 @@ class MiniTelLiteClient:
     data transmission.
     """
     
+    __slots__ = ("host", "port", "use_tls", "timeout", "socket", "ssl_context", "connected", "last_nonce")
+    
     DEFAULT_TIMEOUT = 5.0  # seconds
-    DEFAULT_BUFFER_SIZE = 4096  # bytes
+    LENGTH_PREFIX_SIZE = _LENGTH_PREFIX.size  # bytes
     
     def __init__(self, host: str, port: int, use_tls: bool = False, timeout: float = DEFAULT_TIMEOUT):
         """
@@ -50,9 +60,13 @@ class MiniTelLiteClient:
             # Create TCP socket
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(self.timeout)
-            
+
+            # Frames are small request/response messages; disable Nagle's algorithm
+            # so they are not held back waiting for more data (before any TLS wrap)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
             # Connect to server
-            logger.debug(f"Connecting to {self.host}:{self.port}")
+            logger.debug("Connecting to {}:{}", self.host, self.port)
             self.socket.connect((self.host, self.port))
             
             # Wrap with TLS if requested
@@ -64,10 +78,10 @@ class MiniTelLiteClient:
             logger.info("Successfully connected to server")
             
         except socket.timeout as e:
-            logger.error(f"Connection timeout: {str(e)}")
+            logger.error("Connection timeout: {}", e)
             raise TimeoutError(f"Connection to {self.host}:{self.port} timed out after {self.timeout} seconds") from e
         except socket.error as e:
-            logger.error(f"Connection error: {str(e)}")
+            logger.error("Connection error: {}", e)
             raise ConnectionError(f"Failed to connect to {self.host}:{self.port}: {str(e)}") from e
     
     def disconnect(self) -> None:
@@ -79,7 +93,7 @@ class MiniTelLiteClient:
                 logger.debug("Initiating graceful disconnect")
                 self.socket.shutdown(socket.SHUT_RDWR)
             except socket.error as e:
-                logger.warning(f"Error during shutdown: {str(e)}")
+                logger.warning("Error during shutdown: {}", e)
             finally:
                 self.socket.close()
                 self.socket = None
@@ -101,21 +115,21 @@ class MiniTelLiteClient:
             raise ConnectionError("Not connected to server")
         
         try:
-            logger.debug(f"Sending {len(data)} bytes of data")
+            logger.debug("Sending {} bytes of data", len(data))
             self.socket.sendall(data)
         except socket.error as e:
-            logger.error(f"Error sending data: {str(e)}")
+            logger.error("Error sending data: {}", e)
             raise ConnectionError(f"Failed to send data: {str(e)}") from e
     
-    def receive(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> bytes:
+    def receive(self) -> bytes:
         """
-        Receive data from the server
+        Receive one length-prefixed frame from the server
         
-        Args:
-            buffer_size: Size of buffer for receiving data
+        Reads the 2-byte length prefix and then exactly that many bytes, so a
+        frame delivered across several TCP segments is returned whole.
             
         Returns:
-            Received bytes
+            Received frame bytes, including the length prefix
             
         Raises:
             ConnectionError: If receive operation fails
@@ -125,40 +139,72 @@ class MiniTelLiteClient:
             raise ConnectionError("Not connected to server")
         
         try:
-            logger.debug(f"Receiving data with buffer size {buffer_size}")
-            data = self.socket.recv(buffer_size)
-            
-            if not data:
-                logger.warning("Empty response received - connection may be closed")
-                raise ConnectionError("Connection closed by server")
+            prefix = self._recv_exact(self.LENGTH_PREFIX_SIZE)
+            frame_length = _LENGTH_PREFIX.unpack_from(prefix, 0)[0]
+            logger.debug("Receiving frame of {} bytes", frame_length)
+            data = prefix + self._recv_exact(frame_length)
             
-            logger.debug(f"Received {len(data)} bytes of data")
+            logger.debug("Received {} bytes of data", len(data))
             return data
         except socket.error as e:
-            logger.error(f"Error receiving data: {str(e)}")
+            logger.error("Error receiving data: {}", e)
             raise ConnectionError(f"Failed to receive data: {str(e)}") from e
     
-    def _create_ssl_context(self) -> ssl.SSLContext:
+    def _recv_exact(self, size: int) -> bytes:
         """
-        Create a secure SSL/TLS context
+        Read exactly size bytes from the socket
         
+        Args:
+            size: Number of bytes to read
+            
         Returns:
-            Configured SSLContext object
+            The bytes read
+            
+        Raises:
+            ConnectionError: If the server closes the connection first
+        """
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            count = self.socket.recv_into(view[received:], size - received)
+            if not count:
+                logger.warning("Empty response received - connection may be closed")
+                raise ConnectionError("Connection closed by server")
+            received += count
+        return bytes(buffer)
+    
+    def _create_ssl_context(self) -> ssl.SSLContext:
         """
-        logger.debug("Creating SSL context")
-        context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-        
-        # Enforce secure protocols and cipher suites
-        context.options |= ssl.OP_NO_SSLv2 | ssl.OP_NO_SSLv3 | ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1
+        Get the secure SSL/TLS context shared by all client instances
         
-        # Require certificate validation
-        context.check_hostname = True
-        context.verify_mode = ssl.CERT_REQUIRED
+        The context is built on first use and reused afterwards, so the trust
+        store is loaded once per process and reconnections can resume TLS
+        sessions from its session cache.
         
-        # Use modern cipher suites
-        context.set_ciphers("DEFAULT@SECLEVEL=2")
+        Returns:
+            Configured SSLContext object
+        """
+        global _SHARED_SSL_CONTEXT
+        if _SHARED_SSL_CONTEXT is None:
+            with _SHARED_SSL_CONTEXT_LOCK:
+                if _SHARED_SSL_CONTEXT is None:
+                    logger.debug("Creating SSL context")
+                    context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+                    
+                    # Enforce secure protocols and cipher suites
+                    context.options |= ssl.OP_NO_SSLv2 | ssl.OP_NO_SSLv3 | ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1
+                    
+                    # Require certificate validation
+                    context.check_hostname = True
+                    context.verify_mode = ssl.CERT_REQUIRED
+                    
+                    # Use modern cipher suites
+                    context.set_ciphers("DEFAULT@SECLEVEL=2")
+                    
+                    _SHARED_SSL_CONTEXT = context
         
-        return context
+        return _SHARED_SSL_CONTEXT
     
     def get_connection_status(self) -> bool:
         """
@@ -186,4 +232,4 @@ class MiniTelLiteClient:
             nonce: New nonce value
         """
         self.last_nonce = nonce
-        logger.debug(f"Updated last nonce to {nonce}")
+        logger.debug("Updated last nonce to {}", nonce)
@@ -2,6 +2,9 @@ import logging
 import sys
 from loguru import logger
 
+# Sinks are configured once per process, on the first get_logger call
+_CONFIGURED = False
+
 def get_logger(name: str):
     """
     Configure and get a logger instance for the MiniTel-Lite client
@@ -12,23 +15,26 @@ def get_logger(name: str):
     Returns:
         Configured logger instance
     """
-    # Configure Loguru logger
-    logger.remove()  # Remove default handler
-    
-    # Add stdout handler with debug level
-    logger.add(
-        sys.stdout,
-        level="DEBUG",
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
-    )
-    
-    # Add file handler with info level
-    logger.add(
-        "minitel_lite_client.log",
-        level="INFO",
-        rotation="10 MB",
-        retention="7 days",
-        compression="zip"
-    )
+    global _CONFIGURED
+    if not _CONFIGURED:
+        # Configure Loguru logger
+        logger.remove()  # Remove default handler
+        
+        # Add stdout handler with debug level
+        logger.add(
+            sys.stdout,
+            level="DEBUG",
+            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+        )
+        
+        # Add file handler with info level
+        logger.add(
+            "minitel_lite_client.log",
+            level="INFO",
+            rotation="10 MB",
+            retention="7 days",
+            compression="zip"
+        )
+        _CONFIGURED = True
     
     return logger.opt(depth=1)
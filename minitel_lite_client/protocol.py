@@ -1,9 +1,40 @@
 import struct
+import logging
 import base64
+import binascii
 import hashlib
-from typing import Tuple, Optional, Dict, Any
+import hmac
+import functools
+from typing import Tuple, Optional, Dict, Any, List, NamedTuple
 from minitel_lite_client.exceptions import ProtocolError, InvalidNonceError, MalformedFrameError, HashValidationError, Base64DecodeError
 
+logger = logging.getLogger(__name__)
+
+# Prefer the SIMD Base64 codec from pybase64 when it is installed
+try:
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
+
+# Binary frame size below which the stdlib codec beats the SIMD one: for small
+# control frames pybase64's call overhead outweighs its per-byte speed. Those
+# frames go straight to the binascii C codec, skipping the base64 module wrapper.
+SIMD_BASE64_MIN_SIZE = 128
+
+# SHA-256 constructor bound once at import. OpenSSL dispatches to the SHA-NI
+# instructions at runtime when the CPU supports them; hashlib is the fallback
+# for interpreters built without the _hashlib extension.
+try:
+    from _hashlib import openssl_sha256 as _sha256
+except ImportError:
+    _sha256 = hashlib.sha256
+
+# BLAKE3 is only used by the experimental protocol version 4
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
 # Protocol constants from PRD
 CMD_HELLO = 0x01
 CMD_DUMP = 0x02
@@ -14,30 +45,99 @@ RESPONSE_DUMP_OK = 0x83
 RESPONSE_DUMP_FAILED = 0x82
 RESPONSE_STOP_OK = 0x84
 
+# Command sequence of a complete session
+SESSION_COMMANDS = (CMD_HELLO, CMD_DUMP, CMD_DUMP, CMD_STOP)
+
 # Frame structure constants
 CMD_SIZE = 1
 NONCE_SIZE = 4
 PAYLOAD_SIZE = 65535
 HASH_SIZE = 32
 MIN_FRAME_SIZE = CMD_SIZE + NONCE_SIZE + HASH_SIZE
+MIN_ENCODED_FRAME_SIZE = 4 * ((MIN_FRAME_SIZE + 2) // 3)
+
+# Precompiled big-endian field formats for the nonce and the length prefix
+_U32 = struct.Struct("!I")
+_U16 = struct.Struct("!H")
 
 # Protocol version
 PROTOCOL_VERSION = 3
 
+# Frame hash constructor per protocol version. Version 4 is an experimental
+# variant hashing frames with BLAKE3 and requires a server that supports it.
+FRAME_HASHES = {PROTOCOL_VERSION: _sha256}
+if _blake3 is not None:
+    FRAME_HASHES[4] = _blake3
+
+
+class Frame(NamedTuple):
+    """
+    Decoded components of a MiniTel-Lite frame
+
+    The payload is a view into the decoded frame rather than a copy; use
+    bytes(frame.payload) where an independent bytes object is needed.
+    """
+    cmd: int
+    nonce: int
+    payload: memoryview
+    hash: bytes
+
+
+def _build_frame(cmd: int, nonce: int, payload: bytes, hash_func=_sha256) -> bytes:
+    """Build the length-prefixed, Base64 encoded frame for CMD + NONCE + PAYLOAD"""
+    # Validate command
+    if not isinstance(cmd, int) or not (0x00 <= cmd <= 0xFF):
+        raise ProtocolError(f"Invalid command value: {cmd}")
+
+    # Assemble the binary frame (CMD + NONCE + PAYLOAD + HASH) in a single buffer
+    hash_end = CMD_SIZE + NONCE_SIZE + len(payload)
+    buf = bytearray(hash_end + HASH_SIZE)
+    buf[0] = cmd
+    _U32.pack_into(buf, 1, nonce)
+    buf[5:hash_end] = payload
+
+    # Hash the header and payload in place and append the digest
+    buf[hash_end:] = hash_func(memoryview(buf)[:hash_end]).digest()
+
+    # Base64 encode the binary frame straight from the buffer
+    if len(buf) < SIMD_BASE64_MIN_SIZE:
+        encoded_frame = binascii.b2a_base64(buf, newline=False)
+    else:
+        encoded_frame = _b64.b64encode(buf)
+
+    # Prepend 2-byte length prefix (big-endian) and return the complete encoded frame
+    return _U16.pack(len(encoded_frame)) + encoded_frame
+
+
+# Frames are a pure function of (cmd, nonce, payload, hash). The HELLO/DUMP/DUMP/STOP
+# exchange sends the same frames on every connection, so they are built once.
+# Only short payloads are cached so that large ones are not kept alive as keys.
+# The cache is typed so that a 1.0 command never hits the entry built for 1 and
+# skips the command validation.
+FRAME_CACHE_MAX_PAYLOAD = 32
+_build_frame_cached = functools.lru_cache(maxsize=256, typed=True)(_build_frame)
+
 class MiniTelLiteProtocol:
     """Implementation of the MiniTel-Lite Protocol Version 3.0"""
 
-    def __init__(self):
-        """Initialize the protocol handler"""
+    __slots__ = ("version", "hash_func", "client_nonce", "last_sent_nonce")
+
+    def __init__(self, version: int = PROTOCOL_VERSION):
+        """
+        Initialize the protocol handler
+
+        Args:
+            version (int): Protocol version, which selects the frame hash algorithm
+
+        Raises:
+            ProtocolError: If the version is unsupported or its hash is unavailable
+        """
+        if version not in FRAME_HASHES:
+            raise ProtocolError(f"Unsupported protocol version: {version}")
+        self.version = version
+        self.hash_func = FRAME_HASHES[version]
         self.client_nonce = 0
         self.last_sent_nonce = 0
-        self.command_sequence = []
-        self.logger = self._setup_logger()
-
-    def _setup_logger(self):
-        """Set up logger for the protocol handler"""
-        import logging
-        return logging.getLogger("minitel_lite_client")
 
     def encode_frame(self, cmd: int, nonce: int, payload: bytes = b"") -> bytes:
         """
@@ -54,31 +154,9 @@ class MiniTelLiteProtocol:
         Raises:
             ProtocolError: If there is an error encoding the frame
         """
-        try:
-            # Validate command
-            if not isinstance(cmd, int) or not (0x00 <= cmd <= 0xFF):
-                raise ProtocolError(f"Invalid command value: {cmd}")
-
-            # Pack nonce as 4-byte big-endian
-            nonce_bytes = struct.pack("!I", nonce)
-
-            # Create binary frame (CMD + NONCE + PAYLOAD + HASH)
-            binary_frame = bytes([cmd]) + nonce_bytes + payload + hashlib.sha256(bytes([cmd]) + nonce_bytes + payload).digest()
-
-            # Base64 encode the binary frame
-            encoded_frame = base64.b64encode(binary_frame)
-
-            # Prepend 2-byte length prefix (big-endian)
-            frame_length = struct.pack("!H", len(encoded_frame))
+        return _build_frame(cmd, nonce, payload, self.hash_func)
 
-            # Return the complete encoded frame
-            return frame_length + encoded_frame
-        
-        except Exception as e:
-            self.logger.error(f"Error encoding frame: {str(e)}")
-            raise
-
-    def decode_frame(self, data: bytes) -> Dict[str, Any]:
+    def decode_frame(self, data: bytes) -> Frame:
         """
         Decode a frame according to the MiniTel-Lite protocol.
 
@@ -86,52 +164,60 @@ class MiniTelLiteProtocol:
             data (bytes): Raw frame data
 
         Returns:
-            Dict[str, Any]: Decoded frame components
+            Frame: Decoded frame components
 
         Raises:
             MalformedFrameError: If the frame is malformed
             HashValidationError: If the frame hash is invalid
             Base64DecodeError: If the frame cannot be Base64 decoded
         """
+        # Extract length prefix (2 bytes, big-endian)
+        if len(data) < 2:
+            raise MalformedFrameError("Frame too short to contain length prefix")
+        frame_length = _U16.unpack_from(data, 0)[0]
+
+        # Padded Base64 always comes in 4-character groups; reject any other
+        # length before spending an allocation and a decode on it
+        if frame_length % 4:
+            raise MalformedFrameError(f"Invalid encoded frame length {frame_length}: not a multiple of 4")
+
+        # Reject frames that cannot decode to MIN_FRAME_SIZE bytes, or that the
+        # buffer does not fully contain, before any Base64 or hash work
+        if frame_length < MIN_ENCODED_FRAME_SIZE:
+            raise MalformedFrameError(f"Frame too short. Expected at least {MIN_ENCODED_FRAME_SIZE} encoded bytes, got {frame_length}")
+        if 2 + frame_length > len(data):
+            raise MalformedFrameError(f"Frame truncated. Expected {frame_length} encoded bytes, got {len(data) - 2}")
+
+        # Extract Base64 encoded data
+        encoded_frame = data[2:frame_length + 2]
+
+        # Base64 decode the frame
         try:
-            # Extract length prefix (2 bytes, big-endian)
-            if len(data) < 2:
-                raise MalformedFrameError("Frame too short to contain length prefix")
-            frame_length = struct.unpack("!H", data[:2])[0]
-
-            # Extract Base64 encoded data
-            encoded_frame = data[2:frame_length + 2]
-
-            # Base64 decode the frame
-            binary_frame = base64.b64decode(encoded_frame)
-
-            # Validate frame length
-            if len(binary_frame) < MIN_FRAME_SIZE:
-                raise MalformedFrameError(f"Binary frame too short. Expected at least {MIN_FRAME_SIZE} bytes, got {len(binary_frame)}")
-
-            # Extract components from binary frame
-            cmd = binary_frame[0]
-            nonce = struct.unpack("!I", binary_frame[1:5])[0]
-            payload = binary_frame[5:-HASH_SIZE]
-            hash_value = binary_frame[-HASH_SIZE:]
-
-            # Validate frame hash
-            expected_hash = hashlib.sha256(bytes([cmd]) + struct.pack("!I", nonce) + payload).digest()
-            if hash_value != expected_hash:
-                raise HashValidationError("Frame hash validation failed")
-
-            return {
-                "cmd": cmd,
-                "nonce": nonce,
-                "payload": payload,
-                "hash": hash_value
-            }
-        
-        except Exception as e:
-            self.logger.error(f"Error decoding frame: {str(e)}")
-            if isinstance(e, ProtocolError):
-                raise
-            raise MalformedFrameError(f"Frame decoding failed: {str(e)}")
+            if frame_length * 3 // 4 < SIMD_BASE64_MIN_SIZE:
+                binary_frame = binascii.a2b_base64(encoded_frame)
+            else:
+                binary_frame = _b64.b64decode(encoded_frame, validate=False)
+        except binascii.Error as e:
+            logger.error("Error decoding frame: %s", e)
+            raise Base64DecodeError(f"Frame Base64 decoding failed: {e}") from e
+
+        # Validate frame length
+        if len(binary_frame) < MIN_FRAME_SIZE:
+            raise MalformedFrameError(f"Binary frame too short. Expected at least {MIN_FRAME_SIZE} bytes, got {len(binary_frame)}")
+
+        # Extract components from binary frame
+        cmd = binary_frame[0]
+        nonce = _U32.unpack_from(binary_frame, 1)[0]
+        view = memoryview(binary_frame)
+        payload = view[5:-HASH_SIZE]
+        hash_value = binary_frame[-HASH_SIZE:]
+
+        # Validate frame hash over CMD + NONCE + PAYLOAD without copying them
+        expected_hash = self.hash_func(view[:-HASH_SIZE]).digest()
+        if not hmac.compare_digest(hash_value, expected_hash):
+            raise HashValidationError("Frame hash validation failed")
+
+        return Frame(cmd, nonce, payload, hash_value)
 
     def validate_nonce(self, received_nonce: int) -> bool:
         """
@@ -146,20 +232,15 @@ class MiniTelLiteProtocol:
         Raises:
             InvalidNonceError: If the nonce is invalid
         """
-        try:
-            # Server should respond with client's sent nonce value + 1
-            expected_nonce = self.last_sent_nonce + 1
+        # Server should respond with client's sent nonce value + 1
+        expected_nonce = self.last_sent_nonce + 1
 
-            if received_nonce != expected_nonce:
-                error_msg = f"Nonce mismatch. Expected {expected_nonce}, got {received_nonce}"
-                self.logger.error(error_msg)
-                raise InvalidNonceError(error_msg)
+        if received_nonce != expected_nonce:
+            error_msg = f"Nonce mismatch. Expected {expected_nonce}, got {received_nonce}"
+            logger.error(error_msg)
+            raise InvalidNonceError(error_msg)
 
-            return True
-        
-        except Exception as e:
-            self.logger.error(f"Nonce validation error: {str(e)}")
-            raise
+        return True
 
     def handle_server_response(self, response_data: bytes) -> Dict[str, Any]:
         """
@@ -176,21 +257,20 @@ class MiniTelLiteProtocol:
         """
         try:
             decoded = self.decode_frame(response_data)
-            self.validate_nonce(decoded["nonce"])
-            self.client_nonce += 1
 
-            response_handlers = {
-                RESPONSE_HELLO_ACK: self._handle_hello_ack,
-                RESPONSE_DUMP_OK: self._handle_dump_ok,
-                RESPONSE_DUMP_FAILED: self._handle_dump_failed,
-                RESPONSE_STOP_OK: self._handle_stop_ok
-            }
+            # Same check as validate_nonce, inlined for the per-frame path
+            nonce = decoded.nonce
+            if nonce != self.last_sent_nonce + 1:
+                error_msg = f"Nonce mismatch. Expected {self.last_sent_nonce + 1}, got {nonce}"
+                logger.error(error_msg)
+                raise InvalidNonceError(error_msg)
+            self.client_nonce += 1
 
-            handler = response_handlers.get(decoded["cmd"], self._handle_unknown_response)
-            return handler(decoded)
+            handler = self._RESPONSE_HANDLERS.get(decoded.cmd, type(self)._handle_unknown_response)
+            return handler(self, decoded)
         
         except Exception as e:
-            self.logger.error(f"Error handling server response: {str(e)}")
+            logger.error("Error handling server response: %s", e)
             raise
 
     def send_command(self, cmd: int, payload: bytes = b"") -> bytes:
@@ -208,9 +288,6 @@ class MiniTelLiteProtocol:
             ProtocolError: If there is an error sending the command
         """
         try:
-            # Update command sequence
-            self.command_sequence.append(cmd)
-
             # Reset client nonce for HELLO command
             if cmd == CMD_HELLO:
                 self.client_nonce = 0
@@ -220,8 +297,12 @@ class MiniTelLiteProtocol:
             # Use current client nonce for this command
             nonce = self.client_nonce
 
-            # Encode the frame
-            encoded_frame = self.encode_frame(cmd, nonce, payload)
+            # Encode the frame, reusing previously built frames for int commands with
+            # short bytes payloads; anything else goes through the uncached validation
+            if type(cmd) is int and isinstance(payload, bytes) and len(payload) <= FRAME_CACHE_MAX_PAYLOAD:
+                encoded_frame = _build_frame_cached(cmd, nonce, payload, self.hash_func)
+            else:
+                encoded_frame = self.encode_frame(cmd, nonce, payload)
 
             # Track the last sent nonce before incrementing
             self.last_sent_nonce = nonce
@@ -229,10 +310,29 @@ class MiniTelLiteProtocol:
             return encoded_frame
         
         except Exception as e:
-            self.logger.error(f"Error sending command: {str(e)}")
+            logger.error("Error sending command: %s", e)
             raise
 
-    def _handle_hello_ack(self, decoded: Dict[str, Any]) -> Dict[str, Any]:
+    def build_session_frames(self) -> List[bytes]:
+        """
+        Build the frames for a complete HELLO, DUMP, DUMP, STOP session.
+
+        Nonces follow the sequence send_command produces when every command is
+        answered before the next one is sent, so the frames can be written to
+        the server in a single batch. The protocol state is not modified.
+
+        Returns:
+            List[bytes]: Encoded frames in session order
+        """
+        frames = []
+        nonce = 0
+        for cmd in SESSION_COMMANDS:
+            frames.append(_build_frame_cached(cmd, nonce, b"", self.hash_func))
+            # Each response and the following command both advance the client nonce
+            nonce += 2
+        return frames
+
+    def _handle_hello_ack(self, decoded: Frame) -> Dict[str, Any]:
         """Handle HELLO_ACK response"""
         return {
             "command": "HELLO",
@@ -240,16 +340,16 @@ class MiniTelLiteProtocol:
             "message": "Connection initialized successfully"
         }
 
-    def _handle_dump_ok(self, decoded: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_dump_ok(self, decoded: Frame) -> Dict[str, Any]:
         """Handle DUMP_OK response"""
         return {
             "command": "DUMP",
             "status": "success",
             "message": "Memory dump retrieved successfully",
-            "data": decoded["payload"].decode("utf-8") if decoded["payload"] else None
+            "data": str(decoded.payload, "utf-8") if decoded.payload else None
         }
     
-    def _handle_dump_failed(self, decoded: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_dump_failed(self, decoded: Frame) -> Dict[str, Any]:
         """Handle DUMP_FAILED response"""
         return {
             "command": "DUMP",
@@ -257,7 +357,7 @@ class MiniTelLiteProtocol:
             "message": "Failed to retrieve memory dump"
         }
     
-    def _handle_stop_ok(self, decoded: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_stop_ok(self, decoded: Frame) -> Dict[str, Any]:
         """Handle STOP_OK response"""
         return {
             "command": "STOP",
@@ -265,8 +365,18 @@ class MiniTelLiteProtocol:
             "message": "Connection acknowledged"
         }
     
-    def _handle_unknown_response(self, decoded: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_unknown_response(self, decoded: Frame) -> Dict[str, Any]:
         """Handle unknown response"""
-        error_msg = f"Unknown response command: 0x{decoded['cmd']:02X}"
-        self.logger.error(error_msg)
+        error_msg = f"Unknown response command: 0x{decoded.cmd:02X}"
+        logger.error(error_msg)
         raise ProtocolError(error_msg)
+
+    # Response command to handler function, built once at class definition. The
+    # entries are the functions defined above, so a subclass overriding one of
+    # these _handle_* methods must also provide its own _RESPONSE_HANDLERS table.
+    _RESPONSE_HANDLERS = {
+        RESPONSE_HELLO_ACK: _handle_hello_ack,
+        RESPONSE_DUMP_OK: _handle_dump_ok,
+        RESPONSE_DUMP_FAILED: _handle_dump_failed,
+        RESPONSE_STOP_OK: _handle_stop_ok
+    }
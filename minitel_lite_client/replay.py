@@ -22,6 +22,16 @@ except Exception:
     # If locale setting fails, continue with default — safe_addstr will still prevent crashes
     pass
 
+# orjson parses large recordings considerably faster than the stdlib decoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fixed header lines of the replay screen
+HEADER = " MiniTel-Lite Session Replay "
+NAV_INFO = " [N]ext | [P]revious | [Q]uit "
+
 
 def safe_addstr(
     win: "curses._CursesWindow",
@@ -94,12 +104,80 @@ class SessionReplayTUI:
         Args:
             session_data: List of session events to display
         """
-        self.session_data = session_data
         self.current_step = 0
         self.total_steps = len(session_data)
         self.screen: Optional["curses._CursesWindow"] = None
         self.max_y = 0
         self.max_x = 0
+        # Separator line and the screen width it was built for
+        self._separator_cache = (0, "")
+
+        # Display lines for every step, rendered once into parallel columns so
+        # that navigating only indexes into them. A step whose data cannot be
+        # rendered has None in the requests column.
+        self.requests: List[Optional[str]] = []
+        self.timestamps: List[str] = []
+        self.statuses: List[Optional[str]] = []
+        self.status_ok: List[bool] = []
+        self.commands: List[str] = []
+        self.messages: List[str] = []
+        self.data_strs: List[Optional[str]] = []
+        for step_data in session_data:
+            self._render_step(step_data)
+
+    def _render_step(self, step_data: Dict[str, Any]) -> None:
+        """
+        Render the display lines of one step and append them to the columns.
+
+        Args:
+            step_data: Data for the step
+        """
+        try:
+            # Be defensive: use .get to avoid KeyError
+            ts = step_data.get("timestamp")
+            try:
+                timestamp = (
+                    datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+                    if isinstance(ts, (int, float))
+                    else str(ts)
+                )
+            except Exception:
+                timestamp = str(ts)
+
+            request = f" {step_data.get('request', '<no request>')} "
+            status = command = message = ""
+            status_ok = False
+            data_str = None
+
+            response = step_data.get("response")
+            if response is None:
+                status = None
+            else:
+                status = str(response.get("status", "unknown")).lower()
+                status_ok = status == "success"
+                status = f"Status: {status.upper()}"
+                command = f"Command: {response.get('command', '<no command>')}"
+                message = f"Message: {response.get('message', '')}"
+
+                data = response.get("data")
+                if data:
+                    # Convert data to a one-line representation to avoid multi-line overflow.
+                    try:
+                        data_str = json.dumps(data, ensure_ascii=False)
+                    except Exception:
+                        data_str = str(data)
+        except Exception:
+            request = None
+            timestamp = status = command = message = data_str = ""
+            status_ok = False
+
+        self.requests.append(request)
+        self.timestamps.append(f"Timestamp: {timestamp}")
+        self.statuses.append(status)
+        self.status_ok.append(status_ok)
+        self.commands.append(command)
+        self.messages.append(message)
+        self.data_strs.append(data_str)
 
     def start(self) -> None:
         """Start the TUI application"""
@@ -166,14 +244,12 @@ class SessionReplayTUI:
             return
 
         # Draw header
-        header = " MiniTel-Lite Session Replay "
-        header_x = max(0, (self.max_x - len(header)) // 2)
-        safe_addstr(self.screen, 0, header_x, header, curses.A_BOLD)
+        header_x = max(0, (self.max_x - len(HEADER)) // 2)
+        safe_addstr(self.screen, 0, header_x, HEADER, curses.A_BOLD)
 
         # Draw navigation info
-        nav_info = " [N]ext | [P]revious | [Q]uit "
-        nav_x = max(0, (self.max_x - len(nav_info)) // 2)
-        safe_addstr(self.screen, 1, nav_x, nav_info)
+        nav_x = max(0, (self.max_x - len(NAV_INFO)) // 2)
+        safe_addstr(self.screen, 1, nav_x, NAV_INFO)
 
         # Draw step counter
         step_counter = f" Step {self.current_step + 1} of {self.total_steps} "
@@ -181,69 +257,53 @@ class SessionReplayTUI:
         header_attr = (curses.color_pair(5) | curses.A_BOLD) if curses.has_colors() else curses.A_BOLD
         safe_addstr(self.screen, 2, step_x, step_counter, header_attr)
 
-        # Draw horizontal separator: create a safe separator string
+        # Draw horizontal separator, rebuilt only when the terminal width changes
         if self.max_x > 0:
-            separator = "─" * (self.max_x - 1)
-            safe_addstr(self.screen, 3, 0, separator)
+            if self._separator_cache[0] != self.max_x:
+                self._separator_cache = (self.max_x, "─" * (self.max_x - 1))
+            safe_addstr(self.screen, 3, 0, self._separator_cache[1])
 
         # Draw current step data
         if self.total_steps > 0 and 0 <= self.current_step < self.total_steps:
-            try:
-                self._draw_step_data(self.session_data[self.current_step])
-            except Exception:
+            if self.requests[self.current_step] is None:
                 # Protect entire draw from unexpected data errors
                 safe_addstr(self.screen, 5, 2, "Error rendering step data", curses.A_BOLD | curses.A_REVERSE)
+            else:
+                self._draw_step_data(self.current_step)
 
-    def _draw_step_data(self, step_data: Dict[str, Any]) -> None:
+    def _draw_step_data(self, step: int) -> None:
         """
-        Draw the data for the current step.
+        Draw the pre-rendered data for a step.
 
         Args:
-            step_data: Data for the current step
+            step: Index of the step to draw
         """
-        # Be defensive: use .get to avoid KeyError
-        ts = step_data.get("timestamp")
-        try:
-            timestamp = (
-                datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
-                if isinstance(ts, (int, float))
-                else str(ts)
-            )
-        except Exception:
-            timestamp = str(ts)
-
         # Draw request section
         safe_addstr(self.screen, 5, 2, "REQUEST:", curses.color_pair(5) | curses.A_BOLD if curses.has_colors() else curses.A_BOLD)
-        safe_addstr(self.screen, 5, 11, f" {step_data.get('request', '<no request>')} ")
-        safe_addstr(self.screen, 6, 2, f"Timestamp: {timestamp}")
+        safe_addstr(self.screen, 5, 11, self.requests[step])
+        safe_addstr(self.screen, 6, 2, self.timestamps[step])
 
         # Draw response section
         safe_addstr(self.screen, 8, 2, "RESPONSE:", curses.color_pair(5) | curses.A_BOLD if curses.has_colors() else curses.A_BOLD)
 
-        response = step_data.get("response")
-        if response is None:
+        status = self.statuses[step]
+        if status is None:
             safe_addstr(self.screen, 9, 2, "No response data available", curses.color_pair(2) if curses.has_colors() else 0)
         else:
-            status = str(response.get("status", "unknown")).lower()
-            status_color = curses.color_pair(1) if (curses.has_colors() and status == "success") else (curses.color_pair(2) if curses.has_colors() else 0)
-            safe_addstr(self.screen, 9, 2, f"Status: {status.upper()}", status_color)
+            status_color = curses.color_pair(1) if (curses.has_colors() and self.status_ok[step]) else (curses.color_pair(2) if curses.has_colors() else 0)
+            safe_addstr(self.screen, 9, 2, status, status_color)
 
             # Draw command
-            safe_addstr(self.screen, 10, 2, f"Command: {response.get('command', '<no command>')}")
+            safe_addstr(self.screen, 10, 2, self.commands[step])
 
             # Draw message
-            safe_addstr(self.screen, 11, 2, f"Message: {response.get('message', '')}")
+            safe_addstr(self.screen, 11, 2, self.messages[step])
 
             # Draw data if available
-            data = response.get("data")
-            if data:
+            data_str = self.data_strs[step]
+            if data_str is not None:
                 safe_addstr(self.screen, 13, 2, "DATA:", curses.color_pair(5) if curses.has_colors() else 0)
-                # Convert data to a one-line representation to avoid multi-line overflow.
-                try:
-                    data_str = json.dumps(data, ensure_ascii=False)
-                except Exception:
-                    data_str = str(data)
-                safe_addstr(self.screen, 14, 2, f"{data_str}", (curses.color_pair(1) | curses.A_BOLD) if curses.has_colors() else curses.A_BOLD)
+                safe_addstr(self.screen, 14, 2, data_str, (curses.color_pair(1) | curses.A_BOLD) if curses.has_colors() else curses.A_BOLD)
 
     def _next_step(self) -> None:
         """Move to the next step"""
@@ -271,12 +331,16 @@ def load_session_file(filepath: str) -> List[Dict[str, Any]]:
         json.JSONDecodeError: If the file is not valid JSON
     """
     try:
+        if orjson is not None:
+            with open(filepath, "rb") as f:
+                return orjson.loads(f.read())
         with open(filepath, "r", encoding="utf-8") as f:
             return json.load(f)
     except FileNotFoundError:
         print(f"Error: Session file '{filepath}' not found")
         sys.exit(1)
     except json.JSONDecodeError:
+        # orjson.JSONDecodeError is a subclass, so both parsers end up here
         print(f"Error: Session file '{filepath}' is not valid JSON")
         sys.exit(1)
 
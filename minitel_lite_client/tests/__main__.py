@@ -0,0 +1,7 @@
+"""Run the whole test suite in one pytest session: python -m minitel_lite_client.tests [pytest args]"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.exit(pytest.main([str(Path(__file__).parent), "-v", "--import-mode=importlib", *sys.argv[1:]]))
@@ -0,0 +1,90 @@
+import pytest
+
+# pytest-socket is optional; when installed, tests that reach for the real
+# network fail immediately instead of stalling on DNS or connection timeouts
+try:
+    import pytest_socket
+except ImportError:
+    pytest_socket = None
+
+def pytest_collection_modifyitems(items):
+    """Mark every test so pytest-socket blocks real socket access while it runs"""
+    if pytest_socket is None:
+        return
+    
+    for item in items:
+        item.add_marker(pytest.mark.disable_socket)
+
+class FakeSock:
+    """Minimal socket stand-in recording the calls the client makes"""
+    
+    def __init__(self, data=b"", chunk_size=None):
+        self.stream = bytearray(data)
+        self.chunk_size = chunk_size
+        self.connect_error = None
+        self.sockopts = []
+        self.sendall_args = []
+        self.recv_into_calls = 0
+        self.shutdown_how = None
+        self.closed = False
+    
+    def settimeout(self, timeout):
+        self.timeout = timeout
+    
+    def setsockopt(self, level, option, value):
+        self.sockopts.append((level, option, value))
+    
+    def connect(self, address):
+        if self.connect_error is not None:
+            raise self.connect_error
+        self.address = address
+    
+    def sendall(self, data):
+        self.sendall_args.append(data)
+    
+    def recv_into(self, view, nbytes=0):
+        """Serve the queued data in chunks of at most chunk_size bytes"""
+        self.recv_into_calls += 1
+        count = min(nbytes or len(view), self.chunk_size or len(self.stream), len(self.stream))
+        view[:count] = self.stream[:count]
+        del self.stream[:count]
+        return count
+    
+    def shutdown(self, how):
+        self.shutdown_how = how
+    
+    def close(self):
+        self.closed = True
+
+class FakeSocketRegistry:
+    """Socket constructor stand-in keeping every fake socket created during a test"""
+    
+    def __init__(self):
+        self.sockets = []
+        self.connect_error = None
+    
+    def __call__(self, *args, **kwargs):
+        return self.make()
+    
+    def make(self, data=b"", chunk_size=None):
+        """Create and register a fake socket serving data"""
+        sock = FakeSock(data, chunk_size)
+        sock.connect_error = self.connect_error
+        self.sockets.append(sock)
+        return sock
+    
+    @property
+    def last(self):
+        """The most recently created fake socket"""
+        return self.sockets[-1]
+
+@pytest.fixture
+def fake_sockets(monkeypatch):
+    """Fixture making the client create fake sockets instead of real ones
+    
+    The client looks up socket.socket on the stdlib module, so this patches
+    it globally; only tests that request the fixture get the fake.
+    """
+    registry = FakeSocketRegistry()
+    monkeypatch.setattr("minitel_lite_client.client.socket.socket", registry)
+    return registry
@@ -5,7 +5,7 @@ import json
 import tempfile
 from minitel_lite_client.cli import create_arg_parser, save_recording, run_client, main
 from minitel_lite_client.exceptions import ConnectionError, ProtocolError
-from minitel_lite_client.protocol import CMD_HELLO, CMD_DUMP, CMD_STOP
+from minitel_lite_client.protocol import MiniTelLiteProtocol, CMD_HELLO, CMD_DUMP, CMD_STOP, RESPONSE_HELLO_ACK, RESPONSE_DUMP_FAILED, RESPONSE_DUMP_OK, RESPONSE_STOP_OK
 
 # Mock data for testing
 MOCK_HOST = "localhost"
@@ -39,6 +39,10 @@ def test_argument_parsing(arg_parser):
     with pytest.raises(SystemExit):
         arg_parser.parse_args(["--help"])
 
+def test_arg_parser_reused():
+    """Test that the argument parser is built once and reused"""
+    assert create_arg_parser() is create_arg_parser()
+
 def test_save_recording():
     """Test session recording saving functionality"""
     # Create a temporary directory for testing
@@ -56,6 +60,17 @@ def test_save_recording():
             saved_recording = json.load(f)
         assert saved_recording == recording
 
+def test_save_recording_without_orjson(monkeypatch):
+    """Test session recording falls back to the stdlib JSON encoder"""
+    monkeypatch.setattr("minitel_lite_client.cli.orjson", None)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        recording = [{"timestamp": 1234567890.0, "request": "STOP", "response": {"status": "success"}}]
+
+        filepath = save_recording(recording, tmpdir)
+
+        with open(filepath, "r") as f:
+            assert json.load(f) == recording
+
 def test_run_client_success(monkeypatch):
     """Test successful client execution with mock network responses"""
     # Mock network dependencies
@@ -103,6 +118,7 @@ def test_run_client_success(monkeypatch):
         host=MOCK_HOST,
         port=MOCK_PORT,
         no_tls=True,
+        pipeline=False,
         record_session=False,
         recording_dir=MOCK_RECORDING_DIR
     )
@@ -121,6 +137,57 @@ def test_run_client_success(monkeypatch):
     assert os.path.exists(result["session_recording"])
     os.remove(result["session_recording"])  # Clean up
 
+def test_run_client_pipeline():
+    """Test that pipelined sessions send every command in a single write"""
+    encoder = MiniTelLiteProtocol()
+    responses = [
+        encoder.encode_frame(RESPONSE_HELLO_ACK, 1),
+        encoder.encode_frame(RESPONSE_DUMP_FAILED, 3),
+        encoder.encode_frame(RESPONSE_DUMP_OK, 5, b"CODE123"),
+        encoder.encode_frame(RESPONSE_STOP_OK, 7),
+    ]
+    sent = []
+
+    class MockClient:
+        def __init__(self, *args, **kwargs):
+            self.connected = False
+
+        def connect(self):
+            self.connected = True
+
+        def get_connection_status(self):
+            return self.connected
+
+        def send(self, data):
+            sent.append(data)
+
+        def receive(self):
+            return responses.pop(0)
+
+        def disconnect(self):
+            self.connected = False
+
+    args = argparse.Namespace(
+        host=MOCK_HOST,
+        port=MOCK_PORT,
+        no_tls=True,
+        pipeline=True,
+        record_session=True,
+        recording_dir=None
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        args.recording_dir = tmpdir
+        result = run_client(args, client_class=MockClient)
+        with open(result["session_recording"], "r") as f:
+            recording = json.load(f)
+
+    assert result["success"] is True
+    assert result["override_code"] == "CODE123"
+    assert sent == [b"".join(MiniTelLiteProtocol().build_session_frames())]
+    # Every request was sent in the same write, so they share its timestamp
+    assert len({event["timestamp"] for event in recording}) == 1
+
 def test_run_client_connection_error(monkeypatch):
     """Test client behavior when connection fails"""
     # Mock connection error
@@ -135,6 +202,7 @@ def test_run_client_connection_error(monkeypatch):
         host=MOCK_HOST,
         port=MOCK_PORT,
         use_tls=True,
+        pipeline=False,
         record_session=False,
         recording_dir=MOCK_RECORDING_DIR
     )
@@ -169,6 +237,7 @@ def test_run_client_protocol_error(monkeypatch):
         host=MOCK_HOST,
         port=MOCK_PORT,
         use_tls=True,
+        pipeline=False,
         record_session=False,
         recording_dir=MOCK_RECORDING_DIR
     )
@@ -210,6 +279,3 @@ def test_main_function(capsys, monkeypatch):
     captured = capsys.readouterr()
     assert "✅ Connection completed successfully" in captured.stdout
     assert "❌ No override code retrieved" in captured.stdout
-
-if __name__ == "__main__":
-    pytest.main(["-v", __file__])
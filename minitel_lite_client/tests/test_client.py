@@ -1,6 +1,6 @@
 import pytest
 import socket
-from unittest.mock import Mock, patch
+from contextlib import nullcontext
 from minitel_lite_client.client import MiniTelLiteClient
 from minitel_lite_client.exceptions import ConnectionError, TimeoutError, ProtocolError
 
@@ -10,133 +10,96 @@ class TestMiniTelLiteClient:
         """Fixture to create a test client instance"""
         return MiniTelLiteClient("localhost", 7321)
     
-    @patch("minitel_lite_client.client.socket")
-    def test_connect_success(self, mock_socket, client):
-        """Test successful connection to the server"""
-        # Create mock socket and SSL socket
-        mock_sock = Mock()
-        mock_ssl_sock = Mock()
-        
-        # Configure SSL context to return mock SSL socket
-        mock_ssl_context = Mock()
-        mock_ssl_context.wrap_socket.return_value = mock_ssl_sock
-        mock_socket.ssl.create_default_context.return_value = mock_ssl_context
-        
-        # Configure socket to return mock socket
-        mock_socket.socket.return_value = mock_sock
-        
-        client.connect()
-        assert client.connected is True
-    
-    @patch("minitel_lite_client.client.socket.socket")
-    def test_connect_timeout(self, mock_socket, client):
-        """Test connection timeout"""
-        mock_socket.return_value.connect.side_effect = socket.timeout("Connection timed out")
-        
-        with pytest.raises(TimeoutError):
+    @pytest.mark.parametrize("connect_error,expected", [
+        (None, None),
+        (socket.timeout("Connection timed out"), TimeoutError),
+        (socket.error("Connection refused"), ConnectionError),
+    ], ids=["success", "timeout", "failure"])
+    def test_connect(self, fake_sockets, client, connect_error, expected):
+        """Test connecting to the server, including timeout and failure"""
+        fake_sockets.connect_error = connect_error
+        
+        with pytest.raises(expected) if expected else nullcontext():
             client.connect()
+        assert client.connected is (expected is None)
     
-    @patch("minitel_lite_client.client.socket.socket")
-    def test_connect_failure(self, mock_socket, client):
-        """Test connection failure"""
-        mock_socket.return_value.connect.side_effect = socket.error("Connection refused")
-        
-        with pytest.raises(ConnectionError):
-            client.connect()
+    def test_connect_disables_nagle(self, fake_sockets, client):
+        """Test that TCP_NODELAY is set before connecting"""
+        client.connect()
+        assert fake_sockets.last.sockopts == [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
     
-    @patch("minitel_lite_client.client.socket.socket")
-    def test_disconnect(self, mock_socket, client):
+    def test_disconnect(self, fake_sockets, client):
         """Test graceful disconnection"""
-        # Create mock socket and SSL socket
-        mock_sock = Mock()
-        mock_ssl_sock = Mock()
-        
-        # Configure client socket
-        client.socket = mock_ssl_sock
+        sock = fake_sockets.make()
+        client.socket = sock
         client.connected = True
         
         client.disconnect()
         assert client.connected is False
-        mock_ssl_sock.shutdown.assert_called_once_with(socket.SHUT_RDWR)
-        mock_ssl_sock.close.assert_called_once()
+        assert sock.shutdown_how == socket.SHUT_RDWR
+        assert sock.closed is True
     
-    @patch("minitel_lite_client.client.socket.socket")
-    def test_send_data(self, mock_socket, client):
+    @pytest.mark.parametrize("connected,expected", [
+        (True, None),
+        (False, ConnectionError),
+    ], ids=["connected", "not_connected"])
+    def test_send(self, fake_sockets, client, connected, expected):
         """Test sending data to the server"""
-        # Create mock socket and SSL socket
-        mock_sock = Mock()
-        mock_ssl_sock = Mock()
+        sock = fake_sockets.make()
+        if connected:
+            client.socket = sock
+            client.connected = True
         
-        # Configure client socket
-        client.socket = mock_ssl_sock
-        client.connected = True
-        
-        client.send(b"test_data")
-        mock_ssl_sock.sendall.assert_called_once_with(b"test_data")
-    
-    @patch("minitel_lite_client.client.socket.socket")
-    def test_send_not_connected(self, mock_socket, client):
-        """Test sending data when not connected"""
-        with pytest.raises(ConnectionError):
+        with pytest.raises(expected) if expected else nullcontext():
             client.send(b"test_data")
+        if connected:
+            assert sock.sendall_args == [b"test_data"]
+        else:
+            # The fake socket was never attached, so the client must not have one
+            assert (client.socket, client.connected) == (None, False)
     
-    @patch("minitel_lite_client.client.socket.socket")
-    def test_receive_data(self, mock_socket, client):
-        """Test receiving data from the server"""
-        # Create mock socket and SSL socket
-        mock_sock = Mock()
-        mock_ssl_sock = Mock()
-        
-        # Configure client socket
-        client.socket = mock_ssl_sock
-        client.connected = True
-        
-        # Configure receive response
-        mock_ssl_sock.recv.return_value = b"test_response"
-        
-        response = client.receive()
-        assert response == b"test_response"
-        mock_ssl_sock.recv.assert_called_once_with(client.DEFAULT_BUFFER_SIZE)
+    @pytest.mark.parametrize("connected,data,chunk_size,expected,recv_calls", [
+        # 2-byte length prefix followed by the frame body
+        (True, b"\x00\x0dtest_response", None, None, 2),
+        # Frame delivered across several TCP segments, three bytes at a time
+        (True, b"\x00\x0dtest_response", 3, None, 6),
+        # Connection closed before any data
+        (True, b"", None, ConnectionError, 1),
+        # Length prefix announces 13 bytes but only 4 arrive
+        (True, b"\x00\x0dtest", None, ConnectionError, 3),
+        (False, b"", None, ConnectionError, None),
+    ], ids=["data", "split_frame", "empty_response", "truncated_frame", "not_connected"])
+    def test_receive(self, fake_sockets, client, connected, data, chunk_size, expected, recv_calls):
+        """Test receiving a frame from the server"""
+        sock = fake_sockets.make(data, chunk_size)
+        if connected:
+            client.socket = sock
+            client.connected = True
+        
+        with pytest.raises(expected) if expected else nullcontext():
+            assert client.receive() == data
+        if connected:
+            assert sock.recv_into_calls == recv_calls
+        else:
+            # The fake socket was never attached, so the client must not have one
+            assert (client.socket, client.connected) == (None, False)
     
-    @patch("minitel_lite_client.client.socket.socket")
-    def test_receive_not_connected(self, mock_socket, client):
-        """Test receiving data when not connected"""
-        with pytest.raises(ConnectionError):
-            client.receive()
-    
-    @patch("minitel_lite_client.client.socket.socket")
-    def test_receive_empty_response(self, mock_socket, client):
-        """Test receiving empty response (connection closed)"""
-        # Create mock socket and SSL socket
-        mock_sock = Mock()
-        mock_ssl_sock = Mock()
-        
-        # Configure client socket
-        client.socket = mock_ssl_sock
-        client.connected = True
-        
-        # Configure empty response
-        mock_ssl_sock.recv.return_value = b""
-        
-        with pytest.raises(ConnectionError):
-            client.receive()
-        mock_ssl_sock.recv.assert_called_once_with(client.DEFAULT_BUFFER_SIZE)
-    
-    @patch("minitel_lite_client.client.socket.socket")
-    def test_get_connection_status(self, mock_socket, client):
+    def test_get_connection_status(self, fake_sockets, client):
         """Test connection status check"""
         assert client.get_connection_status() is False
         
-        # Create mock socket and SSL socket
-        mock_sock = Mock()
-        mock_ssl_sock = Mock()
-        
-        # Configure client socket
-        client.socket = mock_ssl_sock
+        client.socket = fake_sockets.make()
         client.connected = True
         
         assert client.get_connection_status() is True
     
+    def test_ssl_context_shared(self):
+        """Test that TLS clients share a single SSL context"""
+        first = MiniTelLiteClient("localhost", 7321, use_tls=True)
+        second = MiniTelLiteClient("localhost", 7322, use_tls=True)
+        assert first.ssl_context is not None
+        assert first.ssl_context is second.ssl_context
+    
     def test_get_last_nonce(self, client):
         """Test getting last nonce value"""
         assert client.get_last_nonce() == 0
@@ -147,6 +110,3 @@ class TestMiniTelLiteClient:
         """Test setting last nonce value"""
         client.set_last_nonce(10)
         assert client.get_last_nonce() == 10
-
-if __name__ == "__main__":
-    pytest.main(["-v", __file__])
@@ -1,36 +1,60 @@
 import pytest
+import functools
 import hashlib
 import struct
 import base64
-from minitel_lite_client.protocol import MiniTelLiteProtocol, CMD_HELLO, CMD_DUMP, CMD_STOP, RESPONSE_HELLO_ACK, RESPONSE_DUMP_OK, RESPONSE_DUMP_FAILED, RESPONSE_STOP_OK
-from minitel_lite_client.exceptions import InvalidNonceError, MalformedFrameError, HashValidationError
+from minitel_lite_client.protocol import MiniTelLiteProtocol, CMD_HELLO, CMD_DUMP, CMD_STOP, RESPONSE_HELLO_ACK, RESPONSE_DUMP_OK, RESPONSE_DUMP_FAILED, RESPONSE_STOP_OK, SESSION_COMMANDS, FRAME_CACHE_MAX_PAYLOAD
+from minitel_lite_client.exceptions import ProtocolError, InvalidNonceError, MalformedFrameError, HashValidationError, Base64DecodeError
+
+# Precompiled packers for the nonce and the length prefix, and the frame hash
+_PACK_U32 = struct.Struct('!I').pack
+_PACK_U16 = struct.Struct('!H').pack
+_sha256 = hashlib.sha256
+
+# Hand-built STOP frame for the Base64 decoding test, computed once at import
+_B64_CMD, _B64_NONCE, _B64_PAYLOAD = CMD_STOP, 6, b"base64_data"
+_B64_BODY = bytes([_B64_CMD]) + _PACK_U32(_B64_NONCE) + _B64_PAYLOAD
+_B64_ENCODED = base64.b64encode(_B64_BODY + _sha256(_B64_BODY).digest())
+_B64_FRAME = _PACK_U16(len(_B64_ENCODED)) + _B64_ENCODED
+
+# HELLO frame whose last payload byte was changed after hashing
+_TAMPERED_BODY = bytes([CMD_HELLO]) + _PACK_U32(0) + b"test_data"
+_TAMPERED_ENCODED = base64.b64encode(_TAMPERED_BODY[:-1] + b"X" + _sha256(_TAMPERED_BODY).digest())
+_TAMPERED_FRAME = _PACK_U16(len(_TAMPERED_ENCODED)) + _TAMPERED_ENCODED
+
+@functools.lru_cache(maxsize=32)
+def _canon_frame(cmd, nonce, payload=b""):
+    """Encode a frame once per distinct input and reuse it across tests"""
+    return MiniTelLiteProtocol().encode_frame(cmd, nonce, payload)
 
 class TestMiniTelLiteProtocol:
-    @pytest.fixture
-    def protocol(self):
-        """Fixture to create a test protocol instance"""
-        return MiniTelLiteProtocol()
+    @pytest.fixture(scope="module")
+    def protocol_factory(self):
+        """Fixture providing a factory for fresh test protocol instances"""
+        return MiniTelLiteProtocol
     
-    def test_encode_decode_round_trip(self, protocol):
+    def test_encode_decode_round_trip(self, protocol_factory):
         """Test that encoding and decoding a frame returns the original data"""
+        protocol = protocol_factory()
         # Test HELLO command with no payload
         cmd = CMD_HELLO
         nonce = 0
         payload = b""
         
         # Encode frame
-        encoded = protocol.encode_frame(cmd, nonce, payload)
+        encoded = _canon_frame(cmd, nonce, payload)
         
         # Decode frame
         decoded = protocol.decode_frame(encoded)
         
         # Verify components
-        assert decoded['cmd'] == cmd
-        assert decoded['nonce'] == nonce
-        assert decoded['payload'] == payload
+        assert decoded.cmd == cmd
+        assert decoded.nonce == nonce
+        assert decoded.payload == payload
     
-    def test_encode_with_payload(self, protocol):
+    def test_encode_with_payload(self, protocol_factory):
         """Test frame encoding with payload"""
+        protocol = protocol_factory()
         cmd = CMD_DUMP
         nonce = 2
         payload = b"test_payload"
@@ -38,57 +62,76 @@ class TestMiniTelLiteProtocol:
         encoded = protocol.encode_frame(cmd, nonce, payload)
         decoded = protocol.decode_frame(encoded)
         
-        assert decoded['cmd'] == cmd
-        assert decoded['nonce'] == nonce
-        assert decoded['payload'] == payload
+        assert decoded.cmd == cmd
+        assert decoded.nonce == nonce
+        assert decoded.payload == payload
+    
+    def test_encode_with_large_payload(self, protocol_factory):
+        """Test frame round trip above the SIMD Base64 size threshold"""
+        protocol = protocol_factory()
+        payload = bytes(range(256)) * 8
+
+        encoded = protocol.encode_frame(CMD_DUMP, 2, payload)
+        assert base64.b64decode(encoded[2:])[5:-32] == payload
+        decoded = protocol.decode_frame(encoded)
+        assert isinstance(decoded.payload, memoryview)
+        assert decoded.payload == payload
     
-    def test_hash_validation(self, protocol):
+    def test_hash_validation(self, protocol_factory):
         """Test frame hash validation"""
+        protocol = protocol_factory()
         cmd = CMD_HELLO
         nonce = 0
         payload = b"test_data"
         
         # Create valid frame
-        encoded = protocol.encode_frame(cmd, nonce, payload)
+        encoded = _canon_frame(cmd, nonce, payload)
         decoded = protocol.decode_frame(encoded)
-        assert decoded['cmd'] == cmd
-        
-        # Modify payload to break hash
-        modified_encoded = encoded[:-33] + b"\x00" + encoded[-32:]
+        assert decoded.cmd == cmd
         
+        # Same frame with a modified payload byte but the original hash
         with pytest.raises(HashValidationError):
-            protocol.decode_frame(modified_encoded)
+            protocol.decode_frame(_TAMPERED_FRAME)
     
-    def test_nonce_validation_success(self, protocol):
+    def test_nonce_validation_success(self, protocol_factory):
         """Test successful nonce validation"""
-        # First message should expect nonce 0
-        assert protocol.validate_nonce(0) is True
-        assert protocol.expected_nonce == 1
-        
-        # Next message should expect nonce 1
+        protocol = protocol_factory()
+        # Nothing sent yet, so the server must answer with nonce 0 + 1
         assert protocol.validate_nonce(1) is True
-        assert protocol.expected_nonce == 2
+        
+        # Validation does not change the nonce state
+        assert (protocol.client_nonce, protocol.last_sent_nonce) == (0, 0)
+        
+        # After HELLO (0), its response (1) and DUMP (2), the server must answer with 3
+        protocol.send_command(CMD_HELLO)
+        protocol.handle_server_response(protocol.encode_frame(RESPONSE_HELLO_ACK, 1))
+        protocol.send_command(CMD_DUMP)
+        assert protocol.validate_nonce(3) is True
+        assert (protocol.client_nonce, protocol.last_sent_nonce) == (2, 2)
     
-    def test_nonce_validation_failure(self, protocol):
+    def test_nonce_validation_failure(self, protocol_factory):
         """Test nonce validation failure"""
-        # First message should expect nonce 0
-        with pytest.raises(InvalidNonceError):
-            protocol.validate_nonce(1)
+        protocol = protocol_factory()
+        # Nothing sent yet, so the server must answer with nonce 0 + 1
+        with pytest.raises(InvalidNonceError, match="Expected 1, got 2"):
+            protocol.validate_nonce(2)
         
-        # After failure, expected nonce should remain unchanged
-        assert protocol.expected_nonce == 0
+        # After failure, the nonce state should remain unchanged
+        assert (protocol.client_nonce, protocol.last_sent_nonce) == (0, 0)
     
-    def test_hello_response_nonce(self, protocol):
+    def test_hello_response_nonce(self, protocol_factory):
         """Test nonce handling for HELLO response"""
+        protocol = protocol_factory()
         # Send HELLO command
         protocol.send_command(CMD_HELLO)
         
         # Server should respond with nonce = 0 + 1 = 1
         assert protocol.validate_nonce(1) is True
-        assert protocol.expected_nonce == 2
+        assert (protocol.client_nonce, protocol.last_sent_nonce) == (0, 0)
     
-    def test_malformed_frame_errors(self, protocol):
+    def test_malformed_frame_errors(self, protocol_factory):
         """Test error handling for malformed frames"""
+        protocol = protocol_factory()
         # Test short frame
         with pytest.raises(MalformedFrameError):
             protocol.decode_frame(b"\x00")  # Too short for length prefix
@@ -97,61 +140,121 @@ class TestMiniTelLiteProtocol:
         with pytest.raises(MalformedFrameError):
             protocol.decode_frame(b"\x00\x0A\x01")  # Length prefix says 10 bytes, but only 1 provided
     
-    def test_base64_decoding(self, protocol):
+    def test_implausible_length_prefix(self, protocol_factory):
+        """Test that a length prefix no padded Base64 frame can have is rejected"""
+        protocol = protocol_factory()
+        encoded = protocol.encode_frame(CMD_HELLO, 0)
+        truncated = _PACK_U16(len(encoded) - 3) + encoded[2:-1]
+        with pytest.raises(MalformedFrameError, match="multiple of 4"):
+            protocol.decode_frame(truncated)
+    
+    def test_truncated_frame(self, protocol_factory):
+        """Test that frames shorter than their length prefix are rejected"""
+        protocol = protocol_factory()
+        encoded = protocol.encode_frame(CMD_DUMP, 2, b"test_payload")
+        with pytest.raises(MalformedFrameError, match="truncated"):
+            protocol.decode_frame(encoded[:-4])
+        with pytest.raises(MalformedFrameError, match="too short"):
+            protocol.decode_frame(_PACK_U16(48) + encoded[2:50])
+    
+    def test_invalid_base64(self, protocol_factory):
+        """Test that a frame body that is not valid Base64 is rejected"""
+        protocol = protocol_factory()
+        with pytest.raises(Base64DecodeError):
+            protocol.decode_frame(_PACK_U16(52) + b"A" * 49 + b"===")
+    
+    def test_base64_decoding(self, protocol_factory):
         """Test Base64 decoding in frame decoding"""
-        # Create a frame that needs Base64 decoding
-        cmd = CMD_STOP
-        nonce = 6
-        payload = b"base64_data"
-        
-        # Normally frames don't need Base64 decoding, but test the path
-        binary_frame = bytes([cmd]) + struct.pack('!I', nonce) + payload + hashlib.sha256(bytes([cmd]) + struct.pack('!I', nonce) + payload).digest()
-        len_prefix = struct.pack('!H', len(binary_frame))
-        
-        # Wrap in Base64 encoded frame
-        base64_data = base64.b64encode(binary_frame)
-        encoded_frame = len_prefix + base64_data
-        
-        # Decode should handle Base64 automatically
-        decoded = protocol.decode_frame(encoded_frame)
-        assert decoded['cmd'] == cmd
-        assert decoded['nonce'] == nonce
-        assert decoded['payload'] == payload
+        protocol = protocol_factory()
+        decoded = protocol.decode_frame(_B64_FRAME)
+        assert decoded.cmd == _B64_CMD
+        assert decoded.nonce == _B64_NONCE
+        assert decoded.payload == _B64_PAYLOAD
     
-    def test_handle_server_response(self, protocol):
+    @pytest.mark.parametrize("resp_code,nonce,payload,expected_cmd,expected_status,expected_data", [
+        (RESPONSE_HELLO_ACK, 1, b"", 'HELLO', 'success', None),
+        (RESPONSE_DUMP_OK, 3, b"override_code", 'DUMP', 'success', 'override_code'),
+        (RESPONSE_DUMP_FAILED, 5, b"", 'DUMP', 'failed', None),
+    ], ids=["hello_ack", "dump_ok", "dump_failed"])
+    def test_handle_server_response(self, protocol_factory, resp_code, nonce, payload, expected_cmd, expected_status, expected_data):
         """Test server response handling"""
-        # Test HELLO_ACK response
-        hello_frame = protocol.encode_frame(RESPONSE_HELLO_ACK, 1)
-        hello_response = protocol.handle_server_response(hello_frame)
-        assert hello_response['command'] == 'HELLO'
-        assert hello_response['status'] == 'success'
+        protocol = protocol_factory()
+        # Server answers the last sent nonce + 1
+        protocol.last_sent_nonce = nonce - 1
         
-        # Test DUMP_OK response
-        dump_frame = protocol.encode_frame(RESPONSE_DUMP_OK, 3, b"override_code")
-        dump_response = protocol.handle_server_response(dump_frame)
-        assert dump_response['command'] == 'DUMP'
-        assert dump_response['status'] == 'success'
-        assert dump_response['data'] == 'override_code'
-        
-        # Test DUMP_FAILED response
-        dump_fail_frame = protocol.encode_frame(RESPONSE_DUMP_FAILED, 5)
-        dump_fail_response = protocol.handle_server_response(dump_fail_frame)
-        assert dump_fail_response['command'] == 'DUMP'
-        assert dump_fail_response['status'] == 'failed'
+        frame = protocol.encode_frame(resp_code, nonce, payload)
+        response = protocol.handle_server_response(frame)
+        assert response['command'] == expected_cmd
+        assert response['status'] == expected_status
+        if expected_data is not None:
+            assert response['data'] == expected_data
     
-    def test_send_command(self, protocol):
+    def test_send_command(self, protocol_factory):
         """Test send_command method"""
+        protocol = protocol_factory()
         # Test HELLO command
         hello_frame = protocol.send_command(CMD_HELLO)
         hello_decoded = protocol.decode_frame(hello_frame)
-        assert hello_decoded['cmd'] == CMD_HELLO
-        assert hello_decoded['nonce'] == 0  # First command starts at nonce 0
+        assert hello_decoded.cmd == CMD_HELLO
+        assert hello_decoded.nonce == 0  # First command starts at nonce 0
+        
+        # The HELLO_ACK response carries nonce 1
+        protocol.handle_server_response(protocol.encode_frame(RESPONSE_HELLO_ACK, 1))
         
         # Test DUMP command
         dump_frame = protocol.send_command(CMD_DUMP)
         dump_decoded = protocol.decode_frame(dump_frame)
-        assert dump_decoded['cmd'] == CMD_DUMP
-        assert dump_decoded['nonce'] == 1  # Next nonce should be 1
+        assert dump_decoded.cmd == CMD_DUMP
+        assert dump_decoded.nonce == 2  # Next nonce follows the response nonce
+
+    def test_send_command_reuses_cached_frame(self, protocol_factory):
+        """Test that identical commands across sessions reuse the same encoded frame"""
+        protocol = protocol_factory()
+        hello_frame = protocol.send_command(CMD_HELLO)
+        assert MiniTelLiteProtocol().send_command(CMD_HELLO) is hello_frame
+        assert hello_frame == protocol.encode_frame(CMD_HELLO, 0)
 
-if __name__ == "__main__":
-    pytest.main(["-v", __file__])
+    def test_send_command_validates_cached_command(self, protocol_factory):
+        """Test that a non-int command is rejected even after its int twin was cached"""
+        protocol_factory().send_command(CMD_HELLO)
+        with pytest.raises(ProtocolError, match="Invalid command value"):
+            protocol_factory().send_command(float(CMD_HELLO))
+
+    def test_send_command_validates_unhashable_command(self, protocol_factory):
+        """Test that an unhashable command is rejected as a protocol error"""
+        with pytest.raises(ProtocolError, match="Invalid command value"):
+            protocol_factory().send_command([CMD_HELLO])
+
+    def test_send_command_skips_cache_for_long_payload(self, protocol_factory):
+        """Test that frames with long payloads are built fresh on every call"""
+        protocol = protocol_factory()
+        payload = b"x" * (FRAME_CACHE_MAX_PAYLOAD + 1)
+        dump_frame = protocol.send_command(CMD_DUMP, payload)
+        assert MiniTelLiteProtocol().send_command(CMD_DUMP, payload) is not dump_frame
+        assert protocol.decode_frame(dump_frame).payload == payload
+
+    def test_build_session_frames(self, protocol_factory):
+        """Test that batched session frames match the sequential command exchange"""
+        protocol = protocol_factory()
+        frames = protocol.build_session_frames()
+        assert protocol.client_nonce == 0 and protocol.last_sent_nonce == 0
+
+        responses = {CMD_HELLO: RESPONSE_HELLO_ACK, CMD_DUMP: RESPONSE_DUMP_FAILED, CMD_STOP: RESPONSE_STOP_OK}
+        assert len(frames) == len(SESSION_COMMANDS)
+        for cmd, frame in zip(SESSION_COMMANDS, frames):
+            assert protocol.send_command(cmd) == frame
+            protocol.handle_server_response(protocol.encode_frame(responses[cmd], protocol.last_sent_nonce + 1))
+
+    def test_unsupported_version(self):
+        """Test that unknown protocol versions are rejected"""
+        with pytest.raises(ProtocolError):
+            MiniTelLiteProtocol(version=99)
+
+    def test_blake3_round_trip(self):
+        """Test frame encoding and decoding with the BLAKE3 protocol variant"""
+        blake3 = pytest.importorskip("blake3")
+        protocol = MiniTelLiteProtocol(version=4)
+        encoded = protocol.encode_frame(CMD_DUMP, 2, b"test_payload")
+        decoded = protocol.decode_frame(encoded)
+        assert decoded.payload == b"test_payload"
+        assert decoded.hash == blake3.blake3(bytes([CMD_DUMP]) + _PACK_U32(2) + b"test_payload").digest()
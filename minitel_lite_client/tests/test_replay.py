@@ -0,0 +1,42 @@
+import pytest
+from datetime import datetime
+from minitel_lite_client.replay import SessionReplayTUI
+
+# Recording with a complete step, a step missing its keys and a non-dict entry
+MOCK_SESSION = [
+    {"timestamp": 1234567890.0, "request": "DUMP", "response": {"command": "DUMP", "status": "success", "message": "ok", "data": "CODE123"}},
+    {},
+    "not a step",
+]
+
+@pytest.fixture
+def tui():
+    """Fixture providing a TUI built from the mock recording"""
+    return SessionReplayTUI(MOCK_SESSION)
+
+def test_render_step_columns(tui):
+    """Test that a complete step is rendered into every column"""
+    assert tui.total_steps == 3
+    assert all(len(column) == 3 for column in (tui.requests, tui.timestamps, tui.statuses, tui.status_ok, tui.commands, tui.messages, tui.data_strs))
+
+    expected_time = datetime.fromtimestamp(1234567890.0).strftime("%Y-%m-%d %H:%M:%S")
+    assert tui.requests[0] == " DUMP "
+    assert tui.timestamps[0] == f"Timestamp: {expected_time}"
+    assert tui.statuses[0] == "Status: SUCCESS"
+    assert tui.status_ok[0] is True
+    assert tui.commands[0] == "Command: DUMP"
+    assert tui.messages[0] == "Message: ok"
+    assert tui.data_strs[0] == '"CODE123"'
+
+def test_render_malformed_steps(tui):
+    """Test that steps with missing keys or of the wrong type still render"""
+    # Missing keys fall back to placeholders and a step without a response
+    assert tui.requests[1] == " <no request> "
+    assert tui.timestamps[1] == "Timestamp: None"
+    assert tui.statuses[1] is None
+    assert tui.status_ok[1] is False
+    assert tui.data_strs[1] is None
+
+    # A non-dict entry cannot be rendered and is flagged in the requests column
+    assert tui.requests[2] is None
+    assert (tui.timestamps[2], tui.statuses[2], tui.status_ok[2]) == ("Timestamp: ", "", False)
@@ -1,10 +1,36 @@
 #!/usr/bin/env python3
-import pytest
 import os
+import pytest
 import sys
+import time
+import queue
 import argparse
+import importlib
 from pathlib import Path
 
+# pytest-instafail is optional; when installed, failures are reported as they happen
+try:
+    import pytest_instafail
+except ImportError:
+    pytest_instafail = None
+
+# watchdog is optional; it is only needed for --watch
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+# Directory containing this script and pyproject.toml
+PROJECT_ROOT = Path(__file__).resolve().parent
+PACKAGE_DIR = PROJECT_ROOT / "minitel_lite_client"
+
+# Seconds to wait for further file changes before re-running the tests
+WATCH_DEBOUNCE = 0.2
+
+# Seconds between checks for file changes; a blocking wait would not see
+# Ctrl-C on Windows until the next change arrived
+WATCH_POLL_INTERVAL = 0.5
+
 def create_arg_parser():
     """Create and configure the argument parser for the test runner"""
     parser = argparse.ArgumentParser(
@@ -13,6 +39,8 @@ def create_arg_parser():
         Example usage:
           %(prog)s --verbose
           %(prog)s --test-dir minitel_lite_client/tests
+          %(prog)s --parallel
+          %(prog)s --watch
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -20,13 +48,21 @@ def create_arg_parser():
     # Test execution options
     test_group = parser.add_argument_group("Test Execution Options")
     test_group.add_argument("--verbose", "-v", action="store_true", 
-                          help="Enable verbose output (show test names)")
+                          help="Enable verbose output (show the pytest header and test names)")
     test_group.add_argument("--test-dir", type=str, default="minitel_lite_client/tests",
                           help="Directory containing test files (default: minitel_lite_client/tests)")
     test_group.add_argument("--html-report", type=str, default=None,
                           help="Generate HTML report at specified path")
     test_group.add_argument("--junit-xml", type=str, default=None,
                           help="Generate JUnit XML report at specified path")
+    test_group.add_argument("--parallel", "-j", nargs="?", const="auto", default=None,
+                          help="Run tests in parallel with pytest-xdist using N workers (default: auto, one per CPU)")
+    test_group.add_argument("--no-cache", action="store_true",
+                          help="Disable the pytest cache (no .pytest_cache reads or writes)")
+    test_group.add_argument("--stream", action="store_true",
+                          help="Disable output capturing so test output is shown as it is written")
+    test_group.add_argument("--watch", action="store_true",
+                          help="Keep running and re-run tests in the same process when source files change (requires watchdog)")
     
     # Help and version
     parser.add_argument("--version", action="version", version="%(prog)s 1.0",
@@ -34,41 +70,158 @@ def create_arg_parser():
     
     return parser
 
+class _ChangeHandler:
+    """watchdog event handler queueing the paths of modified Python files"""
+    
+    # Only writes count; watchdog also reports files being opened and read,
+    # which reloading and test collection do themselves
+    EVENT_TYPES = ("created", "modified", "moved")
+    
+    def __init__(self, changes):
+        self.changes = changes
+    
+    def dispatch(self, event):
+        if event.is_directory or event.event_type not in self.EVENT_TYPES:
+            return
+        path = getattr(event, "dest_path", "") or event.src_path
+        if path.endswith(".py"):
+            self.changes.put(Path(path).resolve())
+
+def unload_project_modules(watch_dirs):
+    """
+    Remove the project's modules from sys.modules so the next run imports them fresh
+    
+    Every project module is dropped, not only the changed ones: modules that
+    imported a changed one would otherwise keep its old definitions, and
+    module-level state such as logging sinks is bound to the previous run's
+    captured output.
+    
+    Args:
+        watch_dirs: Directories holding the project modules
+    """
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and any(directory in Path(path).resolve().parents for directory in watch_dirs):
+            del sys.modules[name]
+    importlib.invalidate_caches()
+
+def watch_tests(pytest_args, watch_dirs, rerun_failed=True):
+    """
+    Run the tests, then re-run them in this process whenever a source file changes
+    
+    The interpreter, pytest and its plugins stay loaded between runs; only the
+    project's own modules are imported again. Runs until interrupted with Ctrl-C,
+    either while waiting or during a run, and then raises KeyboardInterrupt.
+    
+    Args:
+        pytest_args: Command line arguments for pytest
+        watch_dirs: Directories to watch for modified Python files
+        rerun_failed: Run the last failures first on re-runs (needs the pytest cache)
+    """
+    changes = queue.Queue()
+    observer = Observer()
+    for directory in {str(d) for d in watch_dirs}:
+        observer.schedule(_ChangeHandler(changes), directory, recursive=True)
+    observer.start()
+    
+    rerun_args = pytest_args + (["--failed-first"] if rerun_failed else [])
+    try:
+        # pytest.main handles Ctrl-C itself and reports it through the exit code
+        if pytest.main(pytest_args) == pytest.ExitCode.INTERRUPTED:
+            raise KeyboardInterrupt
+        while True:
+            print("\n👀 Watching for changes (Ctrl-C to stop)")
+            while True:
+                try:
+                    changed = {changes.get(timeout=WATCH_POLL_INTERVAL)}
+                    break
+                except queue.Empty:
+                    continue
+            
+            # Collect the rest of a burst of saves before re-running
+            time.sleep(WATCH_DEBOUNCE)
+            while not changes.empty():
+                changed.add(changes.get_nowait())
+            
+            print(f"🔄 Changed: {', '.join(sorted(path.name for path in changed))}")
+            unload_project_modules(watch_dirs)
+            if pytest.main(rerun_args) == pytest.ExitCode.INTERRUPTED:
+                raise KeyboardInterrupt
+    finally:
+        observer.stop()
+        observer.join()
+
 def main():
-    """Main entry point for the test runner"""
+    """
+    Main entry point for the test runner
+    
+    Once pytest has finished, the runner leaves through os._exit after flushing
+    stdout and stderr. This skips atexit handlers, object finalizers and
+    interpreter teardown, so nothing may rely on them: pytest has already
+    written its reports by then and the client's log sink flushes each record.
+    Ctrl-C still exits through sys.exit so normal cleanup runs, and --watch
+    only ever ends that way.
+    """
     try:
         # Parse command-line arguments
         parser = create_arg_parser()
         args = parser.parse_args()
         
         # Verify test directory exists
-        if not os.path.exists(args.test_dir):
+        test_dir = Path(args.test_dir).resolve()
+        if not test_dir.is_dir():
             print(f"Error: Test directory does not exist: {args.test_dir}")
             sys.exit(1)
         
-        # Build pytest command line arguments
-        pytest_args = [args.test_dir]
+        # Build pytest command line arguments, pinning the rootdir to the
+        # project root so pytest does not probe parent directories for it
+        pytest_args = [str(test_dir), "--rootdir", str(PROJECT_ROOT)]
         
         if args.verbose:
             pytest_args.append("-v")
+        else:
+            # Quiet mode: no header or plugin list, one traceback line per failure
+            pytest_args.extend(["--no-header", "-q", "--tb=line"])
             
         if args.html_report:
             pytest_args.extend(["--html", args.html_report, "--self-contained-html"])
             
         if args.junit_xml:
             pytest_args.extend(["--junitxml", args.junit_xml])
+            
+        if args.parallel:
+            pytest_args.extend(["-n", args.parallel, "--dist=worksteal"])
+            
+        if args.no_cache:
+            pytest_args.extend(["-p", "no:cacheprovider"])
+            
+        if args.stream:
+            pytest_args.append("-s")
+            
+        if pytest_instafail is not None:
+            pytest_args.append("--instafail")
+        
+        if args.watch:
+            if Observer is None:
+                print("Error: --watch requires the watchdog package")
+                sys.exit(1)
+            watch_tests(pytest_args, [PACKAGE_DIR, test_dir], rerun_failed=not args.no_cache)
         
         # Run pytest
-        print(f"🚀 Running tests in {args.test_dir}")
+        if args.verbose:
+            print(f"🚀 Running tests in {args.test_dir}")
         result = pytest.main(pytest_args)
         
         # Print summary
         if result == 0:
             print("\n✅ All tests passed successfully!")
-            sys.exit(0)
         else:
             print("\n❌ Some tests failed")
-            sys.exit(1)
+        
+        # Exit without interpreter teardown; buffered output must be flushed first
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(0 if result == 0 else 1)
             
     except KeyboardInterrupt:
         print("\n\nUser interrupted the test run")
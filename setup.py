@@ -1,16 +1,4 @@
-from setuptools import setup, find_packages
+# Package metadata lives in pyproject.toml; this shim only serves legacy tooling
+from setuptools import setup
 
-setup(
-    name="minitel_lite_client",
-    version="0.1.0",
-    packages=find_packages(),
-    entry_points={
-        'console_scripts': [
-            'minitel-lite=minitel_lite_client.cli:main'
-        ]
-    },
-    install_requires=[
-        # No external dependencies - using standard libraries
-    ],
-    python_requires='>=3.8',
-)
+setup()